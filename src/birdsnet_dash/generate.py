@@ -1,49 +1,68 @@
+import contextlib
+import functools
 import json
 import os
 import shutil
 import tempfile
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
+from importlib import resources
 from pathlib import Path
+from typing import BinaryIO
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from birdsnet_dash.healthcheck import check_all_sites
 
-# Look for templates in several locations.
-# _PACKAGE_DIR is e.g. /opt/birdsnet-dash/lib/python3.13/site-packages/birdsnet_dash
-# Walk up to find the venv/install root (directory containing "lib/")
-_PACKAGE_DIR = Path(__file__).resolve().parent
-_INSTALL_ROOT = _PACKAGE_DIR
-for _parent in _PACKAGE_DIR.parents:
-    if (_parent / "lib").is_dir() and _parent != Path("/"):
-        _INSTALL_ROOT = _parent
-        break
+# templates/ and static/ are bundled into the wheel as package data; in a
+# development checkout they live at the repo root instead.
+_DEV_ROOT = Path(__file__).resolve().parent.parent.parent
 
-_TEMPLATE_SEARCH_PATHS = [
-    _INSTALL_ROOT / "templates",               # installed layout (/opt/birdsnet-dash/templates)
-    _PACKAGE_DIR.parent.parent / "templates",  # development layout (repo root)
-]
+_HISTORY_FILE = "species_seen.jsonl"
+_LEGACY_HISTORY_FILE = "species_seen.json"
+# Fields a history record must have to be loaded
+_HISTORY_KEYS = {"slug", "species", "first_seen"}
+_TEMPLATE_CACHE_DIR = "jinja_cache"
 
-_STATIC_SEARCH_PATHS = [
-    _INSTALL_ROOT / "static",                  # installed layout (/opt/birdsnet-dash/static)
-    _PACKAGE_DIR.parent.parent / "static",     # development layout (repo root)
-]
+
+def _find_resource_dir(name: str) -> Path | None:
+    packaged = resources.files("birdsnet_dash") / name
+    if isinstance(packaged, Path) and packaged.is_dir():
+        return packaged
+    if (_DEV_ROOT / name).is_dir():
+        return _DEV_ROOT / name
+    return None
 
 
+@functools.lru_cache(maxsize=1)
 def find_template_dir() -> Path:
-    for path in _TEMPLATE_SEARCH_PATHS:
-        if (path / "index.html.j2").exists():
-            return path
-    raise FileNotFoundError(
-        f"Could not find templates/index.html.j2 in any of: {_TEMPLATE_SEARCH_PATHS}"
+    path = _find_resource_dir("templates")
+    if path is None or not (path / "index.html.j2").exists():
+        raise FileNotFoundError(
+            f"Could not find templates/index.html.j2 in the package or in {_DEV_ROOT}"
+        )
+    return path
+
+
+@functools.lru_cache(maxsize=1)
+def _get_template(cache_dir: str):
+    """Build the Jinja2 environment once per process and return the compiled template.
+
+    Compiled bytecode is also cached in cache_dir so fresh processes (e.g. cron
+    runs) skip re-parsing the template.
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(find_template_dir())),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
     )
+    return env.get_template("index.html.j2")
 
 
+@functools.lru_cache(maxsize=1)
 def find_static_dir() -> Path | None:
-    for path in _STATIC_SEARCH_PATHS:
-        if path.is_dir():
-            return path
-    return None
+    return _find_resource_dir("static")
 
 
 def copy_static_files(output_dir: str) -> None:
@@ -56,86 +75,160 @@ def copy_static_files(output_dir: str) -> None:
             shutil.copy2(item, os.path.join(output_dir, item.name))
 
 
-def load_species_history(data_dir: str) -> dict:
-    """Load species_seen.json from data_dir. Returns {} if missing."""
-    path = os.path.join(data_dir, "species_seen.json")
-    if not os.path.exists(path):
-        return {}
-    with open(path) as f:
-        return json.load(f)
+def _ensure_dir(path: str) -> None:
+    # A single stat is cheaper than makedirs(), which tries mkdir and catches the error
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
 
 
-def save_species_history(data_dir: str, history: dict) -> None:
-    """Atomic write species_seen.json to data_dir."""
-    os.makedirs(data_dir, exist_ok=True)
-    path = os.path.join(data_dir, "species_seen.json")
-    fd, tmp_path = tempfile.mkstemp(dir=data_dir, suffix=".tmp")
+@contextlib.contextmanager
+def _atomic_writer(dir_path: str, name: str) -> Iterator[BinaryIO]:
+    """Open a binary temp file that atomically replaces dir_path/name on success.
+
+    The temp file is fsynced before it is renamed over the target, and the
+    directory is fsynced afterwards so the rename itself survives a crash.
+    """
+    path = os.path.join(dir_path, name)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(history, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
         os.chmod(tmp_path, 0o644)
         os.replace(tmp_path, path)
     except BaseException:
         os.unlink(tmp_path)
         raise
+    dir_fd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _atomic_write_bytes(dir_path: str, name: str, data: bytes) -> None:
+    """Atomically replace dir_path/name with data."""
+    with _atomic_writer(dir_path, name) as f:
+        f.write(data)
+
 
+def _history_record(slug: str, name: str, info: dict) -> dict:
+    return {
+        "slug": slug,
+        "species": name,
+        "scientific_name": info.get("scientific_name", ""),
+        "image_url": info.get("image_url", ""),
+        "first_seen": info["first_seen"],
+    }
+
+
+def load_species_history(data_dir: str) -> dict:
+    """Load species history from data_dir. Returns {} if missing.
 
-def detect_new_species(sites: list[dict], history: dict, now: str) -> list[dict]:
+    History is an append-only JSON Lines log (species_seen.jsonl) with one
+    record per first sighting of a species at a site. Falls back to the
+    older species_seen.json dict format, which save_species_history migrates.
+    """
+    path = os.path.join(data_dir, _HISTORY_FILE)
+    if not os.path.exists(path):
+        legacy_path = os.path.join(data_dir, _LEGACY_HISTORY_FILE)
+        if not os.path.exists(legacy_path):
+            return {}
+        with open(legacy_path) as f:
+            return json.load(f)
+
+    history: dict = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                # Skip blank lines and a torn line left by an interrupted append
+                continue
+            if not isinstance(rec, dict) or not _HISTORY_KEYS <= rec.keys():
+                continue
+            history.setdefault(rec["slug"], {})[rec["species"]] = {
+                "scientific_name": rec.get("scientific_name", ""),
+                "image_url": rec.get("image_url", ""),
+                "first_seen": rec["first_seen"],
+            }
+    return history
+
+
+def save_species_history(data_dir: str, history: dict) -> None:
+    """Atomic write the full species_seen.jsonl log to data_dir."""
+    _ensure_dir(data_dir)
+    data = "".join(
+        json.dumps(_history_record(slug, name, info)) + "\n"
+        for slug, species_dict in history.items()
+        for name, info in species_dict.items()
+    ).encode()
+    _atomic_write_bytes(data_dir, _HISTORY_FILE, data)
+
+
+def append_species_history(data_dir: str, records: list[dict]) -> None:
+    """Append new history records to species_seen.jsonl and fsync."""
+    if not records:
+        return
+    path = os.path.join(data_dir, _HISTORY_FILE)
+    data = "".join(json.dumps(rec) + "\n" for rec in records).encode()
+    with open(path, "a+b") as f:
+        # An interrupted append can leave a torn last line; terminate it so the
+        # first new record starts on its own line instead of being lost with it
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def detect_new_species(
+    sites: list[dict], history: dict, now: str
+) -> tuple[list[dict], list[dict]]:
     """Compare current species against history. Flag new species.
 
     On first run (empty history for a site), seeds all species without marking as new.
     On subsequent runs, species not in history are flagged as new.
-    Mutates history dict in place. Returns list of new species dicts,
-    grouped by species name (one entry per species with a list of sites).
+    Mutates history dict in place. Returns a tuple of (new species dicts,
+    grouped by species name with a list of sites; history records added
+    this run, for append_species_history).
     """
-    # First pass: update history and collect raw new sightings
-    raw_new: list[dict] = []
+    added: list[dict] = []
+    grouped: dict[str, dict] = {}
     for site in sites:
         slug = site["slug"]
         site_name = site["name"]
-        if slug not in history:
-            # First run for this site — seed all species, don't mark as new
-            history[slug] = {}
-            for s in site.get("species", []):
-                history[slug][s["species"]] = {
-                    "scientific_name": s.get("scientific_name", ""),
-                    "image_url": s.get("image_url", ""),
-                    "first_seen": now,
-                }
-            continue
-
-        for s in site.get("species", []):
+        # First run for this site — seed all species, don't mark as new
+        seeding = slug not in history
+        slug_hist = history.setdefault(slug, {})
+        for s in site.get("species", ()):
             name = s["species"]
-            if name not in history[slug]:
-                history[slug][name] = {
-                    "scientific_name": s.get("scientific_name", ""),
-                    "image_url": s.get("image_url", ""),
-                    "first_seen": now,
-                }
-                raw_new.append({
+            if name in slug_hist:
+                continue
+            sci = s.get("scientific_name", "")
+            img = s.get("image_url", "")
+            info = slug_hist[name] = {"scientific_name": sci, "image_url": img, "first_seen": now}
+            # Same record shape the JSONL writer uses, built from the in-memory entry
+            added.append(_history_record(slug, name, info))
+            if seeding:
+                continue
+            # Group new sightings by species name as we go
+            g = grouped.get(name)
+            if g is None:
+                g = grouped[name] = {
                     "species": name,
-                    "scientific_name": s.get("scientific_name", ""),
-                    "image_url": s.get("image_url", ""),
-                    "site_name": site_name,
-                    "site_slug": slug,
-                })
-
-    # Second pass: group by species name
-    grouped: dict[str, dict] = {}
-    for entry in raw_new:
-        name = entry["species"]
-        if name not in grouped:
-            grouped[name] = {
-                "species": name,
-                "scientific_name": entry["scientific_name"],
-                "image_url": entry["image_url"],
-                "site_names": [],
-            }
-        grouped[name]["site_names"].append(entry["site_name"])
-        if not grouped[name]["image_url"] and entry["image_url"]:
-            grouped[name]["image_url"] = entry["image_url"]
+                    "scientific_name": sci,
+                    "image_url": img,
+                    "site_names": [],
+                }
+            g["site_names"].append(site_name)
+            if img and not g["image_url"]:
+                g["image_url"] = img
 
-    return list(grouped.values())
+    return list(grouped.values()), added
 
 
 def build_recent_new_species(history: dict, days: int = 7) -> list[dict]:
@@ -150,18 +243,29 @@ def build_recent_new_species(history: dict, days: int = 7) -> list[dict]:
     ...     "site-c": {"Owl": {"first_seen": "2099-01-03T00:00:00+00:00", "scientific_name": "O. owl", "image_url": ""}},
     ... }, days=50000)
     [{'species': 'Owl', 'scientific_name': 'O. owl', 'image_url': '', 'sites': [{'slug': 'site-c', 'first_seen': '2099-01-03T00:00:00+00:00'}], 'first_seen': '2099-01-03T00:00:00+00:00'}, {'species': 'Dove', 'scientific_name': 'D. dove', 'image_url': '', 'sites': [{'slug': 'site-a', 'first_seen': '2099-01-01T00:00:00+00:00'}, {'slug': 'site-b', 'first_seen': '2099-01-02T00:00:00+00:00'}], 'first_seen': '2099-01-01T00:00:00+00:00'}]
+    >>> build_recent_new_species({
+    ...     "site-a": {"Dove": {"first_seen": "2000-01-01T00:00:00+00:00"}},
+    ...     "site-b": {"Owl": {"first_seen": "2099-01-01T00:00:00+00:00"}},
+    ...     "site-c": {"Kite": {"first_seen": "unknown"}},
+    ... })
+    [{'species': 'Owl', 'scientific_name': '', 'image_url': '', 'sites': [{'slug': 'site-b', 'first_seen': '2099-01-01T00:00:00+00:00'}], 'first_seen': '2099-01-01T00:00:00+00:00'}]
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    # first_seen values are UTC ISO-8601 strings, which sort lexicographically,
+    # so compare against an ISO cutoff instead of parsing every timestamp.
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
 
     # Collect all recent sightings grouped by species name
     grouped: dict[str, dict] = {}
     for slug, species_dict in history.items():
         for name, info in species_dict.items():
-            try:
-                first_seen = datetime.fromisoformat(info["first_seen"])
-            except (KeyError, ValueError):
+            first_seen = info.get("first_seen")
+            if not isinstance(first_seen, str) or first_seen < cutoff:
                 continue
-            if first_seen < cutoff:
+            # Only recent entries get this far; parse them so junk that merely
+            # sorts after the cutoff (e.g. "unknown") is still rejected
+            try:
+                datetime.fromisoformat(first_seen)
+            except ValueError:
                 continue
             if name not in grouped:
                 grouped[name] = {
@@ -196,41 +300,40 @@ def generate(output_dir: str, data_dir: str | None = None) -> None:
     if data_dir is None:
         data_dir = os.path.join(os.path.dirname(output_dir.rstrip("/")), "data")
 
-    template_dir = find_template_dir()
-    env = Environment(loader=FileSystemLoader(str(template_dir)), autoescape=True)
-    template = env.get_template("index.html.j2")
+    # Keep compiled template bytecode with the other persistent state, since
+    # the default temp dir may be cleaned between cron runs
+    cache_dir = os.path.join(data_dir, _TEMPLATE_CACHE_DIR)
+    _ensure_dir(cache_dir)
+    template = _get_template(cache_dir)
 
     sites = check_all_sites()
     now = datetime.now(timezone.utc)
     now_iso = now.isoformat()
-    now_display = now.strftime("%Y-%m-%d %H:%M:%S UTC")
+    now_display = now.isoformat(sep=" ", timespec="seconds").replace("+00:00", " UTC")
 
     # Species tracking
     history = load_species_history(data_dir)
-    new_species = detect_new_species(sites, history, now_iso)
+    new_species, added = detect_new_species(sites, history, now_iso)
     recent_new_species = build_recent_new_species(history)
-    save_species_history(data_dir, history)
+    if os.path.exists(os.path.join(data_dir, _HISTORY_FILE)):
+        append_species_history(data_dir, added)
+    else:
+        # First run, or migrating from species_seen.json: write the full log
+        save_species_history(data_dir, history)
 
-    html = template.render(
+    stream = template.stream(
         sites=sites,
         generated_at=now_display,
         new_species=new_species,
         recent_new_species=recent_new_species,
     )
+    # Batch template output into larger chunks rather than one write per node
+    stream.enable_buffering(size=64)
 
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, "index.html")
-
-    # Atomic write: write to temp file then rename
-    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w") as f:
-            f.write(html)
-        os.chmod(tmp_path, 0o644)
-        os.replace(tmp_path, output_path)
-    except BaseException:
-        os.unlink(tmp_path)
-        raise
+    # Render straight into the temp file instead of building the page in memory
+    _ensure_dir(output_dir)
+    with _atomic_writer(output_dir, "index.html") as f:
+        stream.dump(f, encoding="utf-8")
 
     # Copy static assets (favicon, etc.)
     copy_static_files(output_dir)
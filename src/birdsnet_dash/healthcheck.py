@@ -1,10 +1,15 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, timedelta
 
 import httpx
 
 from birdsnet_dash.config import INTERFACES, SITES
 from birdsnet_dash.scrape import (
+    CLIENT,
     build_species_summary,
     fetch_detections,
     fetch_species_list,
@@ -12,11 +17,25 @@ from birdsnet_dash.scrape import (
     group_detections,
 )
 
+# Upper bound on in-flight health probes, so sweeping many sites cannot
+# exhaust file descriptors or flood a shared upstream router
+MAX_CONCURRENT_PROBES = 20
+_PROBE_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_PROBES)
 
+# One thread pool shared by every probe and fetch, instead of a new pool per call
+_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="birdsnet")
+atexit.register(_POOL.shutdown)
+
+
+@functools.lru_cache(maxsize=256)
 def check_host(hostname: str) -> bool:
-    """Probe a BirdNET-Pi host by hostname. Returns True if reachable."""
+    """Probe a BirdNET-Pi host by hostname. Returns True if reachable.
+
+    Results are cached; call check_host.cache_clear() to start a fresh poll cycle.
+    """
     try:
-        resp = httpx.get(f"https://{hostname}/", timeout=3, verify=False)
+        with _PROBE_SLOTS:
+            resp = CLIENT.head(f"https://{hostname}/", timeout=3.0)
         return resp.status_code < 500
     except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError):
         return False
@@ -44,15 +63,13 @@ def longest_common_suffix(hostnames: list[str]) -> str:
         return ""
     if len(hostnames) == 1:
         return hostnames[0]
-    split = [h.split(".") for h in hostnames]
-    reversed_labels = [list(reversed(labels)) for labels in split]
-    common = []
-    for labels in zip(*reversed_labels):
-        if len(set(labels)) == 1:
-            common.append(labels[0])
-        else:
-            break
-    return ".".join(reversed(common))
+    reversed_names = [h[::-1] for h in hostnames]
+    prefix = os.path.commonprefix(reversed_names)
+    # Only keep whole labels: the prefix must end where every name ends or has a dot
+    n = len(prefix)
+    if any(len(r) > n and r[n] != "." for r in reversed_names):
+        prefix = prefix[: max(prefix.rfind("."), 0)]
+    return prefix[::-1]
 
 
 def pick_best_host(site: dict) -> str | None:
@@ -97,40 +114,53 @@ def pick_best_host(site: dict) -> str | None:
     return longest_common_suffix(up_hostnames) or None
 
 
-def _check_site(site: dict) -> dict:
-    """Check one site: probe interfaces, scrape bird data if reachable."""
-    host = site["host"]
+def _probe_all_sites() -> list[dict]:
+    """Probe every interface of every site at once and pick each site's best host."""
+    probes = {
+        (site["slug"], iface): _POOL.submit(check_host, f"{iface}.{site['host']}")
+        for site in SITES
+        for iface in INTERFACES
+    }
+
+    results = []
+    for site in SITES:
+        interfaces = {
+            iface: {
+                "hostname": f"{iface}.{site['host']}",
+                "up": probes[(site["slug"], iface)].result(),
+            }
+            for iface in INTERFACES
+        }
+        result = {**site, "interfaces": interfaces}
+        result["best_host"] = pick_best_host(result)
+        results.append(result)
+    return results
+
+
+def _submit_fetches(
+    best_host: str, today: str, yesterday: str
+) -> tuple[Future, Future, Future, Future]:
+    """Start fetching stats, species list, detections, and yesterday list concurrently."""
+    return (
+        _POOL.submit(fetch_stats, best_host),
+        _POOL.submit(fetch_species_list, best_host, today),
+        _POOL.submit(fetch_detections, best_host, 20),
+        _POOL.submit(fetch_species_list, best_host, yesterday),
+    )
 
-    # Probe all interfaces concurrently
-    interfaces = {}
-    with ThreadPoolExecutor(max_workers=len(INTERFACES)) as pool:
-        futures = {}
-        for iface in INTERFACES:
-            fqdn = f"{iface}.{host}"
-            futures[pool.submit(check_host, fqdn)] = (iface, fqdn)
-        for future in as_completed(futures):
-            iface, fqdn = futures[future]
-            interfaces[iface] = {"hostname": fqdn, "up": future.result()}
 
-    result = {**site, "interfaces": interfaces}
-    best_host = pick_best_host(result)
-    result["best_host"] = best_host
+def _scrape_site(site: dict, fetches: tuple[Future, ...] | None) -> dict:
+    """Collect a probed site's fetched bird data and build its species summaries."""
+    result = dict(site)
 
-    if not best_host:
+    if fetches is None:
         result["stats"] = None
         result["detections"] = []
         result["species"] = []
         result["yesterday_species"] = []
         return result
 
-    # Fetch stats, species list, detections, and yesterday list concurrently
-    yesterday = (date.today() - timedelta(days=1)).isoformat()
-    with ThreadPoolExecutor(max_workers=4) as pool:
-        f_stats = pool.submit(fetch_stats, best_host)
-        f_species = pool.submit(fetch_species_list, best_host)
-        f_detect = pool.submit(fetch_detections, best_host, 20)
-        f_yester = pool.submit(fetch_species_list, best_host, yesterday)
-
+    f_stats, f_species, f_detect, f_yester = fetches
     result["stats"] = f_stats.result()
     species_names = f_species.result()
     detections = f_detect.result()
@@ -138,6 +168,7 @@ def _check_site(site: dict) -> dict:
     yesterday_names = f_yester.result()
 
     # Build species summaries (metadata fetches parallelised internally)
+    best_host = result["best_host"]
     result["species"] = build_species_summary(
         species_names, detections, hostname=best_host
     )
@@ -148,12 +179,20 @@ def _check_site(site: dict) -> dict:
 
 
 def check_all_sites() -> list[dict]:
-    """Check all interfaces for each site, then scrape bird data from reachable ones."""
-    with ThreadPoolExecutor(max_workers=len(SITES)) as pool:
-        futures = {pool.submit(_check_site, site): site["slug"] for site in SITES}
-        results_by_slug = {}
-        for future in as_completed(futures):
-            slug = futures[future]
-            results_by_slug[slug] = future.result()
-    # Preserve original site order
-    return [results_by_slug[site["slug"]] for site in SITES]
+    """Probe all interfaces of all sites together, then scrape bird data from reachable ones."""
+    # Computed once so every site agrees on "today" and "yesterday", and the
+    # two lists never point at the same date, even across midnight
+    run_date = date.today()
+    today = run_date.isoformat()
+    yesterday = (run_date - timedelta(days=1)).isoformat()
+    # Reachability may have changed since the previous cycle
+    check_host.cache_clear()
+    sites = _probe_all_sites()
+    # Queue every site's fetches before any _scrape_site task, so a worker
+    # waiting on them can never starve the fetches of pool threads
+    fetches = [
+        _submit_fetches(s["best_host"], today, yesterday) if s["best_host"] else None
+        for s in sites
+    ]
+    # map() preserves the original site order
+    return list(_POOL.map(_scrape_site, sites, fetches))
@@ -1,8 +1,72 @@
+import atexit
+import functools
+import itertools
 import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import date
 
 import httpx
 
+# Patterns are compiled once at import rather than looked up in re's cache per call.
+# Possessive quantifiers and bounded cell bodies keep matching linear even
+# on truncated or malformed HTML (e.g. a missing </td>).
+_RE_TD = re.compile(r"<td[^>]*+>((?:[^<]++|<(?!/?td[\s>]))*+)</td>")
+_RE_BTN = re.compile(r"<button[^>]*+>(\d++)</button>")
+_RE_NUM = re.compile(r"(\d+)")
+_RE_SPECIES = re.compile(r'class="a2"[^>]*+>([^<]++)</')
+_RE_SCI = re.compile(r"<i>([^<]++)")
+_RE_TIME = re.compile(r"(\d{2}:\d{2}:\d{2})")
+_RE_CONF = re.compile(r"Confidence:</b>\s*+(\d++)%")
+_RE_IMG = re.compile(r'src="([^"]++)"[^>]*class="img1"')
+_RE_LINK = re.compile(
+    r'href="(?:(https://wikipedia\.org/wiki/[^"]++)|index\.php\?filename=([^"]++))"'
+)
+_RE_WIKI_PAGE = re.compile(r'href="(https://wikipedia\.org/wiki/([^"]++))"')
+# Lookup caches are keyed by time bucket, so entries expire for long-running callers
+_STATS_PAGE_TTL = 60
+_WIKI_TTL = 3600
+_METADATA_INDEX_TTL = 60
+# Detection rows fetched for the bulk species metadata index
+_METADATA_INDEX_LIMIT = 500
+# MediaWiki's per-request title limit for non-bot clients
+_WIKI_BATCH_SIZE = 50
+# Wikipedia image lookups shared by the single and batched paths:
+# {search term: (time bucket, image URL)}
+_WIKI_CACHE: dict[str, tuple[int, str]] = {}
+# Batched lookups currently in flight: {search term: Future of image URL}
+_WIKI_PENDING: dict[str, Future] = {}
+_WIKI_LOCK = threading.Lock()
+
+# Detection rows start with a fixed literal, found with str.find rather than a regex
+_ROW_START = '<tr class="relative"'
+
+# Shared pooled client for BirdNET-Pi hosts, so repeated fetches to the same
+# host reuse one connection instead of a new TCP+TLS handshake each time.
+# Health probes use it too, so one SSL context serves every BirdNET-Pi request.
+CLIENT = httpx.Client(
+    http2=True,
+    verify=False,
+    timeout=httpx.Timeout(5.0, connect=3.0),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+atexit.register(CLIENT.close)
+
+# Wikipedia gets its own client: certificates are verified there, and the
+# User-Agent identifies the dashboard as Wikimedia's API policy asks
+_WIKI_CLIENT = httpx.Client(
+    http2=True,
+    timeout=5.0,
+    headers={"User-Agent": "birdsnet-dash/0.1 (https://birds.mithis.com/)"},
+)
+atexit.register(_WIKI_CLIENT.close)
+
+# Runs speculative lookups alongside the metadata fallback ladder
+_LOOKUP_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="birdsnet-lookup")
+atexit.register(_LOOKUP_POOL.shutdown)
+
 
 def fetch_stats(hostname: str) -> dict | None:
     """Fetch today's summary stats from a BirdNET-Pi instance.
@@ -14,14 +78,18 @@ def fetch_stats(hostname: str) -> dict | None:
     {'total': 11536, 'today': 599, 'last_hour': 26, 'species_total': 24, 'species_today': 10}
     """
     try:
-        resp = httpx.get(
-            f"https://{hostname}/todays_detections.php?today_stats=true",
-            timeout=5,
-            verify=False,
-        )
-        if resp.status_code >= 400:
+        url = f"https://{hostname}/todays_detections.php?today_stats=true"
+        with CLIENT.stream("GET", url) as resp:
+            if resp.status_code >= 400:
+                return None
+            # Only the first five cells are needed; stop reading once they've arrived
+            html = ""
+            for chunk in resp.iter_text():
+                html += chunk
+                stats = parse_stats_html(html)
+                if stats is not None:
+                    return stats
             return None
-        return parse_stats_html(resp.text)
     except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError):
         return None
 
@@ -36,18 +104,16 @@ def parse_stats_html(html: str) -> dict | None:
     """
     # Extract all numbers from <td> and <button> elements in the stats row
     # The order is: Total, Today (in button), Last Hour, Species Total (in button), Species Today (in button)
-    tds = re.findall(r"<td[^>]*>(.*?)</td>", html, re.DOTALL)
-    if len(tds) < 5:
-        return None
-
+    # Only the first five cells matter, so stop scanning the page after them
     values = []
-    for td in tds[:5]:
+    for cell in itertools.islice(_RE_TD.finditer(html), 5):
         # Look for number in a <button> first, then plain text
-        btn = re.search(r"<button[^>]*>(\d+)</button>", td)
+        start, end = cell.span(1)
+        btn = _RE_BTN.search(html, start, end)
         if btn:
             values.append(int(btn.group(1)))
         else:
-            num = re.search(r"(\d+)", td)
+            num = _RE_NUM.search(html, start, end)
             if num:
                 values.append(int(num.group(1)))
 
@@ -80,11 +146,7 @@ def fetch_species_list(hostname: str, for_date: str | None = None) -> list[str]:
     if for_date is None:
         for_date = date.today().isoformat()
     try:
-        resp = httpx.get(
-            f"https://{hostname}/By_Date/{for_date}/",
-            timeout=5,
-            verify=False,
-        )
+        resp = CLIENT.get(f"https://{hostname}/By_Date/{for_date}/")
         if resp.status_code >= 400:
             return []
         return parse_species_dirs(resp.text)
@@ -102,10 +164,15 @@ def parse_species_dirs(html: str) -> list[str]:
     >>> parse_species_dirs('no folders here')
     []
     """
-    # Caddy lists folders as ./Folder_Name/ links
-    folders = re.findall(r'href="\./([^/"]+)/"', html)
-    species = [f.replace("_", " ") for f in folders]
-    return sorted(species)
+    # Caddy lists folders as ./Folder_Name/ links; plain string scanning is
+    # enough for this fixed context and skips the regex engine
+    species = []
+    for chunk in html.split('href="./')[1:]:
+        name, sep, _ = chunk.partition('/"')
+        if sep and name and "/" not in name and '"' not in name:
+            species.append(name.replace("_", " "))
+    species.sort()
+    return species
 
 
 def fetch_detections(hostname: str, limit: int = 20) -> list[dict]:
@@ -117,59 +184,86 @@ def fetch_detections(hostname: str, limit: int = 20) -> list[dict]:
 
     Returns list of dicts with keys: species, scientific_name, time, confidence, image_url.
     """
+    return parse_detections_html(_fetch_detections_html(hostname, limit))
+
+
+def _fetch_detections_html(hostname: str, limit: int) -> str:
+    """Fetch the raw hard_limit detections HTML, or an empty string on failure."""
     try:
-        resp = httpx.get(
+        resp = CLIENT.get(
             f"https://{hostname}/todays_detections.php?ajax_detections=true&hard_limit={limit}",
             timeout=10,
-            verify=False,
         )
         if resp.status_code >= 400:
-            return []
-        return parse_detections_html(resp.text)
+            return ""
+        return resp.text
     except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError):
-        return []
+        return ""
 
 
 def parse_detections_html(html: str) -> list[dict]:
     """Parse detection entries from BirdNET-Pi ajax_detections HTML.
 
-    Handles both HTML formats returned by BirdNET-Pi:
-    - hard_limit format: species in <button class="a2">, time in separate <td>
-    - display_limit format: species in <a class="a2">, time inline
+    See iter_detections_html for the formats handled.
 
     >>> parse_detections_html('<tr class="relative" id="1"><td class="relative"><div class="centered_image_container">14:53:59<br><b><a class="a2" href="x">Spotted Dove</a></b><br><i>Streptopelia chinensis</i><br><b>Confidence:</b> 75%<br></div></td>')
     [{'species': 'Spotted Dove', 'scientific_name': 'Streptopelia chinensis', 'time': '14:53:59', 'confidence': 75, 'image_url': '', 'wikipedia_url': '', 'filename': ''}]
     >>> parse_detections_html('<tr class="relative" id="1"><td>10:00:00<br></td><td id="recent_detection_middle_td"><div><div><img style="float:left" src="https://example.com/bird.jpg" id="birdimage" class="img1"></div><div><form><button class="a2" type="submit" name="species" value="Magpie">Magpie</button><br><i>\\nGymnorhina tibicen\\t<br></i></form></div></div></td><td><b>Confidence:</b>88%<br></td><td><a href="index.php?filename=Magpie-88-2026-02-21-birdnet-10:00:00.mp3">x</a><a href="https://wikipedia.org/wiki/Gymnorhina_tibicen">w</a></td>')
     [{'species': 'Magpie', 'scientific_name': 'Gymnorhina tibicen', 'time': '10:00:00', 'confidence': 88, 'image_url': 'https://example.com/bird.jpg', 'wikipedia_url': 'https://wikipedia.org/wiki/Gymnorhina_tibicen', 'filename': 'Magpie-88-2026-02-21-birdnet-10:00:00.mp3'}]
     """
-    detections = []
-    # Each detection is in a <tr class="relative"> block
-    rows = re.split(r'<tr class="relative"', html)
-    for row in rows[1:]:  # skip before first match
+    return list(iter_detections_html(html))
+
+
+def iter_detections_html(html: str) -> Iterator[dict]:
+    """Yield detection entries from BirdNET-Pi ajax_detections HTML, in page order.
+
+    Handles both HTML formats returned by BirdNET-Pi:
+    - hard_limit format: species in <button class="a2">, time in separate <td>
+    - display_limit format: species in <a class="a2">, time inline
+    """
+    # Each detection is in a <tr class="relative"> block. Rows are searched in
+    # place via pos/endpos rather than sliced out of the page.
+    bounds = []
+    pos = html.find(_ROW_START)
+    while pos >= 0:
+        bounds.append(pos)
+        pos = html.find(_ROW_START, pos + len(_ROW_START))
+    bounds.append(len(html))
+    for start, end in zip(bounds, bounds[1:]):
+        start += len(_ROW_START)
+        # Rows without a species link are dropped, so skip them before any regex
+        if html.find('class="a2"', start, end) < 0:
+            continue
         # Species: match both <a class="a2">Name</a> and <button class="a2">Name</button>
-        species_match = re.search(r'class="a2"[^>]*>([^<]+)</', row)
+        species_match = _RE_SPECIES.search(html, start, end)
+        if not species_match:
+            continue
         # Scientific name: <i> may contain <br> and other tags; capture text before first <
-        sci_match = re.search(r"<i>\s*([^<]+)", row)
-        time_match = re.search(r"(\d{2}:\d{2}:\d{2})", row)
-        conf_match = re.search(r"Confidence:</b>\s*(\d+)%", row)
-        img_match = re.search(r'src="([^"]+)"[^>]*class="img1"', row)
-        wiki_match = re.search(r'href="(https://wikipedia\.org/wiki/[^"]+)"', row)
-        file_match = re.search(r'href="index\.php\?filename=([^"]+)"', row)
-
-        if species_match:
-            detections.append({
-                "species": species_match.group(1),
-                "scientific_name": sci_match.group(1).strip() if sci_match else "",
-                "time": time_match.group(1) if time_match else "",
-                "confidence": int(conf_match.group(1)) if conf_match else 0,
-                "image_url": img_match.group(1) if img_match else "",
-                "wikipedia_url": wiki_match.group(1) if wiki_match else "",
-                "filename": file_match.group(1) if file_match else "",
-            })
-    return detections
-
-
-def group_detections(detections: list[dict]) -> list[dict]:
+        sci_match = _RE_SCI.search(html, start, end)
+        time_match = _RE_TIME.search(html, start, end)
+        conf_match = _RE_CONF.search(html, start, end)
+        img_match = _RE_IMG.search(html, start, end)
+        # Wikipedia and recording links come from one scan, in either order
+        wikipedia_url = filename = ""
+        for link in _RE_LINK.finditer(html, start, end):
+            wiki, file = link.groups()
+            if wiki and not wikipedia_url:
+                wikipedia_url = wiki
+            elif file and not filename:
+                filename = file
+
+        yield {
+            "species": species_match.group(1),
+            "scientific_name": sci_match.group(1).strip() if sci_match else "",
+            "time": time_match.group(1) if time_match else "",
+            "confidence": int(conf_match.group(1)) if conf_match else 0,
+            "image_url": img_match.group(1) if img_match else "",
+            "wikipedia_url": wikipedia_url,
+            "filename": filename,
+        }
+
+
+def group_detections(detections: Iterable[dict]) -> list[dict]:
     """Group detections by species, keeping the latest detection's details.
 
     Input detections must be ordered most-recent-first.
@@ -186,10 +280,11 @@ def group_detections(detections: list[dict]) -> list[dict]:
     order: list[str] = []
     for d in detections:
         name = d["species"]
-        if name not in grouped:
+        entry = grouped.get(name)
+        if entry is None:
             order.append(name)
             # First occurrence is the latest (input is most-recent-first)
-            grouped[name] = {
+            entry = grouped[name] = {
                 "species": name,
                 "scientific_name": d.get("scientific_name", ""),
                 "time": d.get("time", ""),
@@ -199,14 +294,16 @@ def group_detections(detections: list[dict]) -> list[dict]:
                 "filename": d.get("filename", ""),
                 "count": 0,
             }
-        grouped[name]["count"] += 1
-        grouped[name]["confidence"] = max(
-            grouped[name]["confidence"], d.get("confidence", 0)
-        )
-        if not grouped[name]["image_url"] and d.get("image_url"):
-            grouped[name]["image_url"] = d["image_url"]
-        if not grouped[name]["wikipedia_url"] and d.get("wikipedia_url"):
-            grouped[name]["wikipedia_url"] = d["wikipedia_url"]
+        entry["count"] += 1
+        confidence = d.get("confidence", 0)
+        if confidence > entry["confidence"]:
+            entry["confidence"] = confidence
+        image_url = d.get("image_url")
+        if image_url and not entry["image_url"]:
+            entry["image_url"] = image_url
+        wikipedia_url = d.get("wikipedia_url")
+        if wikipedia_url and not entry["wikipedia_url"]:
+            entry["wikipedia_url"] = wikipedia_url
     return [grouped[name] for name in order]
 
 
@@ -214,20 +311,29 @@ def fetch_wikipedia_thumbnail(search_term: str) -> str:
     """Fetch a thumbnail image URL from Wikipedia's REST API.
 
     Tries the search_term as a page title (spaces replaced with underscores).
-    Returns the thumbnail URL or empty string if not found.
+    Returns the thumbnail URL or empty string if not found. Results are cached
+    for up to _WIKI_TTL seconds, since the same species recurs across sites
+    and summaries.
 
     >>> fetch_wikipedia_thumbnail("") == ""
     True
     """
     if not search_term:
         return ""
+    bucket = int(time.time() // _WIKI_TTL)
+    hit = _WIKI_CACHE.get(search_term)
+    if hit is not None and hit[0] == bucket:
+        return hit[1]
+    image_url = _fetch_wikipedia_summary_image(search_term)
+    _WIKI_CACHE[search_term] = (bucket, image_url)
+    return image_url
+
+
+def _fetch_wikipedia_summary_image(search_term: str) -> str:
+    """Uncached REST summary lookup for one page title."""
     slug = search_term.strip().replace(" ", "_")
     try:
-        resp = httpx.get(
-            f"https://en.wikipedia.org/api/rest_v1/page/summary/{slug}",
-            timeout=5,
-            headers={"User-Agent": "birdsnet-dash/0.1 (https://birds.mithis.com/)"},
-        )
+        resp = _WIKI_CLIENT.get(f"https://en.wikipedia.org/api/rest_v1/page/summary/{slug}")
         if resp.status_code >= 400:
             return ""
         data = resp.json()
@@ -242,25 +348,142 @@ def fetch_wikipedia_thumbnail(search_term: str) -> str:
         return ""
 
 
+def fetch_wikipedia_thumbnails(search_terms: list[str]) -> dict[str, str]:
+    """Fetch image URLs for many page titles with batched MediaWiki Action API queries.
+
+    Terms already in the Wikipedia cache are answered from it; the misses are
+    sent up to _WIKI_BATCH_SIZE titles per request and cached. Returns
+    {search_term: image URL}; terms without an image are omitted. If a batch
+    request fails, its terms fall back to individual fetch_wikipedia_thumbnail calls.
+
+    >>> fetch_wikipedia_thumbnails([])
+    {}
+    """
+    images = {}
+    owned: dict[str, Future] = {}
+    waiting: dict[str, Future] = {}
+    # The lock only guards the cache and in-flight table; network calls happen
+    # outside it. Terms another thread is already fetching are waited on
+    # rather than queried again.
+    with _WIKI_LOCK:
+        bucket = int(time.time() // _WIKI_TTL)
+        for term in dict.fromkeys(t for t in search_terms if t):
+            hit = _WIKI_CACHE.get(term)
+            if hit is not None and hit[0] == bucket:
+                if hit[1]:
+                    images[term] = hit[1]
+            elif term in _WIKI_PENDING:
+                waiting[term] = _WIKI_PENDING[term]
+            else:
+                owned[term] = _WIKI_PENDING[term] = Future()
+
+    found: dict[str, str] = {}
+    try:
+        misses = list(owned)
+        for i in range(0, len(misses), _WIKI_BATCH_SIZE):
+            batch = misses[i : i + _WIKI_BATCH_SIZE]
+            result = _query_wikipedia_images(batch)
+            if result is None:
+                # Batch request failed: look the titles up individually, in parallel
+                result = dict(zip(batch, _LOOKUP_POOL.map(fetch_wikipedia_thumbnail, batch)))
+            found.update(result)
+    finally:
+        with _WIKI_LOCK:
+            for term, future in owned.items():
+                if term in found:
+                    _WIKI_CACHE[term] = (bucket, found[term])
+                del _WIKI_PENDING[term]
+                future.set_result(found.get(term, ""))
+
+    for term, future in waiting.items():
+        found[term] = future.result()
+    images.update((term, url) for term, url in found.items() if url)
+    return images
+
+
+def _query_wikipedia_images(titles: list[str]) -> dict[str, str] | None:
+    """Run one pageimages query for titles; returns None if the request fails."""
+    try:
+        resp = _WIKI_CLIENT.get(
+            "https://en.wikipedia.org/w/api.php",
+            params={
+                "action": "query",
+                "format": "json",
+                "formatversion": "2",
+                "prop": "pageimages",
+                "piprop": "original|thumbnail",
+                "pithumbsize": "640",
+                "pilimit": "max",
+                "redirects": "1",
+                "titles": "|".join(titles),
+            },
+        )
+        if resp.status_code >= 400:
+            return None
+        return parse_pageimages_query(titles, resp.json().get("query", {}))
+    except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError, ValueError):
+        return None
+
+
+def parse_pageimages_query(titles: list[str], query: dict) -> dict[str, str]:
+    """Map each requested title to its page image from an Action API pageimages query.
+
+    Follows normalisation, then redirects, to the page. Titles without an
+    image, or whose page is missing, map to "".
+
+    >>> parse_pageimages_query(["Tyto_alba", "Barn Owl", "Nope"], {
+    ...     "normalized": [{"from": "Tyto_alba", "to": "Tyto alba"}],
+    ...     "redirects": [{"from": "Barn Owl", "to": "Barn owl"}],
+    ...     "pages": [
+    ...         {"title": "Tyto alba", "original": {"source": "o.jpg"},
+    ...          "thumbnail": {"source": "t.jpg"}},
+    ...         {"title": "Barn owl", "thumbnail": {"source": "owl.jpg"}},
+    ...         {"title": "Nope", "missing": True},
+    ...     ],
+    ... })
+    {'Tyto_alba': 'o.jpg', 'Barn Owl': 'owl.jpg', 'Nope': ''}
+    """
+    normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+    redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+    pages = {}
+    for page in query.get("pages", []):
+        # Prefer the original image for higher resolution, like the REST lookup
+        original = page.get("original", {}).get("source", "")
+        pages[page.get("title")] = original or page.get("thumbnail", {}).get("source", "")
+
+    result = {}
+    for title in titles:
+        page_title = normalized.get(title, title)
+        result[title] = pages.get(redirects.get(page_title, page_title), "")
+    return result
+
+
 def fetch_species_stats_page(hostname: str, species_name: str) -> dict:
     """Scrape scientific name and wikipedia URL from BirdNET-Pi species stats page.
 
     This works even when the species has no detections today, unlike
-    todays_detections.php which only returns today's data.
+    todays_detections.php which only returns today's data. Results are cached
+    for up to _STATS_PAGE_TTL seconds, so the today and yesterday summaries
+    share lookups.
 
     Returns dict with keys: scientific_name, wikipedia_url.
     """
+    bucket = int(time.time() // _STATS_PAGE_TTL)
+    return dict(_cached_species_stats_page(hostname, species_name, bucket))
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_species_stats_page(hostname: str, species_name: str, bucket: int) -> dict:
+    """Uncached stats page scrape; bucket is only part of the cache key."""
     try:
-        resp = httpx.get(
+        resp = CLIENT.get(
             f"https://{hostname}/views.php",
             params={"view": "Species Stats", "species": species_name},
-            timeout=5,
-            verify=False,
         )
         if resp.status_code >= 400:
             return {"scientific_name": "", "wikipedia_url": ""}
         # Wikipedia link contains the scientific name
-        wiki_match = re.search(r'href="(https://wikipedia\.org/wiki/([^"]+))"', resp.text)
+        wiki_match = _RE_WIKI_PAGE.search(resp.text)
         if wiki_match:
             return {
                 "scientific_name": wiki_match.group(2).replace("_", " "),
@@ -271,6 +494,25 @@ def fetch_species_stats_page(hostname: str, species_name: str) -> dict:
     return {"scientific_name": "", "wikipedia_url": ""}
 
 
+def fetch_all_metadata(hostname: str) -> dict[str, dict]:
+    """Fetch metadata for every species in the last _METADATA_INDEX_LIMIT detections at once.
+
+    One hard_limit request replaces a per-species round-trip for everything
+    detected recently. Returns {species: grouped detection}; image and
+    wikipedia URLs are backfilled from older detections when the latest lacks them.
+    The index is cached for up to _METADATA_INDEX_TTL seconds, so a site's today
+    and yesterday summaries share one request (and one timeout if the Pi is slow).
+    """
+    return _cached_metadata_index(hostname, int(time.time() // _METADATA_INDEX_TTL))
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_metadata_index(hostname: str, bucket: int) -> dict[str, dict]:
+    """Uncached metadata index fetch; bucket is only part of the cache key."""
+    html = _fetch_detections_html(hostname, _METADATA_INDEX_LIMIT)
+    return {g["species"]: g for g in group_detections(iter_detections_html(html))}
+
+
 def fetch_species_metadata(hostname: str, species_name: str) -> dict:
     """Fetch metadata for a single species from multiple sources.
 
@@ -285,20 +527,18 @@ def fetch_species_metadata(hostname: str, species_name: str) -> dict:
 
     # Try today's detections first (fastest, has all metadata)
     try:
-        resp = httpx.get(
+        resp = CLIENT.get(
             f"https://{hostname}/todays_detections.php",
             params={
                 "ajax_detections": "true",
                 "hard_limit": "1",
                 "searchterm": species_name,
             },
-            timeout=5,
-            verify=False,
         )
         if resp.status_code < 400:
-            detections = parse_detections_html(resp.text)
-            if detections:
-                d = detections[0]
+            # Only the first row is needed, so stop parsing after it
+            d = next(iter_detections_html(resp.text), None)
+            if d is not None:
                 result = {
                     "scientific_name": d.get("scientific_name", ""),
                     "image_url": d.get("image_url", ""),
@@ -309,8 +549,12 @@ def fetch_species_metadata(hostname: str, species_name: str) -> dict:
     except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError):
         pass
 
-    # Fall back to species stats page for scientific name / wikipedia
+    # Fall back to species stats page for scientific name / wikipedia. The
+    # common-name Wikipedia lookup is started alongside it, so a miss on the
+    # scientific name doesn't cost another serial round-trip
+    common_image: Future | None = None
     if not result["scientific_name"]:
+        common_image = _LOOKUP_POOL.submit(fetch_wikipedia_thumbnail, species_name)
         stats = fetch_species_stats_page(hostname, species_name)
         if stats["scientific_name"]:
             result["scientific_name"] = stats["scientific_name"]
@@ -323,7 +567,10 @@ def fetch_species_metadata(hostname: str, species_name: str) -> dict:
         if result["scientific_name"]:
             result["image_url"] = fetch_wikipedia_thumbnail(result["scientific_name"])
         if not result["image_url"]:
-            result["image_url"] = fetch_wikipedia_thumbnail(species_name)
+            if common_image is not None:
+                result["image_url"] = common_image.result()
+            else:
+                result["image_url"] = fetch_wikipedia_thumbnail(species_name)
 
     return result
 
@@ -355,31 +602,73 @@ def build_species_summary(
     det_data: dict[str, dict] = {}
     for d in detections:
         name = d["species"]
-        if name not in det_data:
-            det_data[name] = {
+        entry = det_data.get(name)
+        if entry is None:
+            entry = det_data[name] = {
                 "scientific_name": d.get("scientific_name", ""),
                 "image_url": d.get("image_url", ""),
                 "wikipedia_url": d.get("wikipedia_url", ""),
                 "recent_count": 0,
                 "max_confidence": 0,
             }
-        det_data[name]["recent_count"] += 1
-        det_data[name]["max_confidence"] = max(
-            det_data[name]["max_confidence"], d.get("confidence", 0)
-        )
-        if not det_data[name]["image_url"] and d.get("image_url"):
-            det_data[name]["image_url"] = d["image_url"]
-        if not det_data[name]["wikipedia_url"] and d.get("wikipedia_url"):
-            det_data[name]["wikipedia_url"] = d["wikipedia_url"]
+        entry["recent_count"] += 1
+        confidence = d.get("confidence", 0)
+        if confidence > entry["max_confidence"]:
+            entry["max_confidence"] = confidence
+        image_url = d.get("image_url")
+        if image_url and not entry["image_url"]:
+            entry["image_url"] = image_url
+        wikipedia_url = d.get("wikipedia_url")
+        if wikipedia_url and not entry["wikipedia_url"]:
+            entry["wikipedia_url"] = wikipedia_url
 
     # For species without metadata, fetch in parallel
     if hostname:
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         needs_meta = [
             name for name in species_names
             if name not in det_data or not det_data[name]["image_url"]
         ]
+        if needs_meta:
+            # One bulk request covers most species; only the rest need the ladder
+            meta_index = fetch_all_metadata(hostname)
+            for name in needs_meta:
+                meta = meta_index.get(name)
+                if meta is None:
+                    continue
+                if name not in det_data:
+                    det_data[name] = {
+                        "recent_count": 0,
+                        "max_confidence": 0,
+                        "scientific_name": meta["scientific_name"],
+                        "image_url": meta["image_url"],
+                        "wikipedia_url": meta["wikipedia_url"],
+                    }
+                else:
+                    for key in ("scientific_name", "image_url", "wikipedia_url"):
+                        if not det_data[name][key] and meta[key]:
+                            det_data[name][key] = meta[key]
+            needs_meta = [
+                name for name in needs_meta
+                if name not in det_data or not det_data[name]["image_url"]
+            ]
+        if needs_meta:
+            # Species that already have a scientific name only lack an image; one
+            # batched Wikipedia query covers them all, by scientific then common name
+            image_only = [
+                name for name in needs_meta
+                if name in det_data and det_data[name]["scientific_name"]
+            ]
+            if image_only:
+                terms = [det_data[name]["scientific_name"] for name in image_only]
+                images = fetch_wikipedia_thumbnails(terms + image_only)
+                for name in image_only:
+                    entry = det_data[name]
+                    image_url = images.get(entry["scientific_name"]) or images.get(name, "")
+                    entry["image_url"] = image_url
+                needs_meta = [
+                    name for name in needs_meta
+                    if name not in det_data or not det_data[name]["scientific_name"]
+                ]
         if needs_meta:
             with ThreadPoolExecutor(max_workers=8) as pool:
                 futures = {
@@ -401,7 +690,9 @@ def build_species_summary(
                                 det_data[name][key] = meta[key]
 
     # Build result: all species from directory, enriched with detection data
-    all_species = set(species_names) | set(det_data.keys())
+    all_species = dict.fromkeys(species_names)
+    # Only the keys matter; merging det_data directly avoids a throwaway dict
+    all_species.update(det_data)
     result = []
     for name in all_species:
         info = det_data.get(name, {})